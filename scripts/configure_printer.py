@@ -6,288 +6,627 @@ by interacting with their web management interface using Selenium.
 """
 
 import yaml
-import time
 import argparse
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Selenium is imported inside the methods that use it, so --help and config
+# errors exit without paying its import cost
+
+
+# Classifies the SMTP form fields in-browser so discovery costs one WebDriver
+# round-trip instead of one per locator / get_attribute call
+FIND_SMTP_FIELDS_JS = """
+const fields = {gateway: null, port: null, reply: null, userid: null, device_pw: null, selects: []};
+const passwords = [];
+for (const el of document.querySelectorAll('input, select')) {
+    if (el.tagName === 'SELECT') {
+        fields.selects.push(el);
+        continue;
+    }
+    const placeholder = el.getAttribute('placeholder') || '';
+    if (!fields.gateway && ['smtp.gmail.com', 'smtp.example.com'].includes(placeholder)) {
+        fields.gateway = el;
+    } else if (el.type === 'email') {
+        fields.reply = fields.reply || el;
+    } else if (el.type === 'password') {
+        passwords.push(el);
+    } else if (el.type === 'text') {
+        if (!fields.port && ['25', '587', '465'].includes(el.value)) {
+            fields.port = el;
+        } else if (!fields.userid && placeholder.includes('@')) {
+            fields.userid = el;
+        }
+    }
+}
+// Skip the first one (login password), use the last one (device password);
+// if only one password field after login, it's the device password
+fields.device_pw = passwords.length ? passwords[passwords.length - 1] : null;
+return fields;
+"""
+
+# Sets input values through the native setter so framework-controlled inputs
+# (React/Vue track the property, not the attribute) pick up the change, then
+# fires the events their listeners expect
+FILL_FIELDS_JS = """
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+for (const [el, value] of arguments[0]) {
+    setValue.call(el, '');
+    setValue.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+# Selects dropdown options by value and reports any value with no matching option
+SELECT_OPTIONS_JS = """
+const missing = [];
+for (const [el, value] of arguments[0]) {
+    if (![...el.options].some(o => o.value === value)) {
+        missing.push(value);
+        continue;
+    }
+    el.value = value;
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return missing;
+"""
+
+# Top-level sections every config file must define
+REQUIRED_SECTIONS = ('target', 'smtp', 'credentials', 'settings')
+
+# Outcome words on the page as (token, passed) pairs in order of precedence,
+# matched case-insensitively as whole words so that "unsuccessful" is never
+# read as "successful". A bare "error" is not an outcome: result pages such as
+# "Errors: 0" or "No error" mention it on success.
+TEST_OUTCOMES = (
+    ("all tests passed", True),
+    ("failed", False),
+    ("unsuccessful", False),
+    ("successful", True),
+)
+SUBMIT_OUTCOMES = (
+    ("failed", False),
+    ("unsuccessful", False),
+    ("saved", True),
+    ("submitted", True),
+    ("success", True),
+    ("successful", True),
+    ("successfully", True),
+)
+
+
+def find_new_outcome(before, after, outcomes):
+    """Return (passed, token) for the first outcome word that appears more often
+    in `after` than in `before`, or False if there is none yet"""
+    for token, passed in outcomes:
+        pattern = re.compile(r"\b" + re.escape(token) + r"\b", re.IGNORECASE)
+        if len(pattern.findall(after)) > len(pattern.findall(before)):
+            return passed, token
+    return False
+
+
+def create_driver(headless=False):
+    """Launch a Chrome WebDriver tuned for the printer web UI"""
+    from selenium import webdriver
+    
+    options = webdriver.ChromeOptions()
+    
+    if headless:
+        options.add_argument('--headless=new')
+        
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1920,1080')
+    
+    # The printer UI only needs the DOM - skip images, extensions and GPU work
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    
+    # Background services that do nothing for a printer-config session
+    options.add_argument(
+        '--disable-features=Translate,OptimizationHints,MediaRouter,InterestCohort,'
+        'AutofillServerCommunication,CalculateNativeWinOcclusion'
+    )
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--no-first-run')
+    options.add_argument('--no-default-browser-check')
+    
+    # Keep renderer scheduling steady, including tabs a pooled browser holds in the background
+    options.add_argument('--disable-renderer-backgrounding')
+    options.add_argument('--disable-ipc-flooding-protection')
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+    })
+    
+    # Return from get() on DOMContentLoaded; explicit waits do the syncing
+    options.page_load_strategy = 'eager'
+    
+    driver = webdriver.Chrome(options=options)
+    # Bound worst-case hangs on slow printer web UIs
+    driver.set_page_load_timeout(15)
+    driver.set_script_timeout(10)
+    return driver
+
+
+class DriverPool:
+    """Reuses launched Chrome instances across printers, one fresh tab per printer"""
+    
+    def __init__(self):
+        """Initialize an empty pool; browsers are launched on first demand"""
+        self._idle = {True: [], False: []}
+        self._launched = {}  # driver -> headless
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def acquire(self, headless=False):
+        """Return an idle browser (launching one if none is free) switched to a new tab"""
+        headless = bool(headless)
+        with self._lock:
+            driver = self._idle[headless].pop() if self._idle[headless] else None
+        if driver is None:
+            driver = create_driver(headless)
+            with self._lock:
+                self._launched[driver] = headless
+        driver.switch_to.new_window('tab')
+        return driver
+    
+    def release(self, driver):
+        """Clear the printer's session, close its tab and return the browser to the pool;
+        returns False if the browser had to be quit instead"""
+        try:
+            self._clear_state(driver)
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+        except Exception:
+            # Browser is unusable or still holds the last session; drop it
+            # rather than hand it to the next printer
+            with self._lock:
+                self._launched.pop(driver, None)
+            self._quit(driver)
+            return False
+        with self._lock:
+            self._idle[self._launched[driver]].append(driver)
+        return True
+    
+    def _clear_state(self, driver):
+        """Drop cookies, cache and site storage so the next printer starts logged out"""
+        origin = driver.execute_script("return location.origin")
+        if origin and origin.startswith("http"):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': origin,
+                'storageTypes': 'all',
+            })
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+    
+    def _quit(self, driver):
+        """Quit a browser, reporting rather than raising on failure"""
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[WARNING] Failed to close browser: {e}")
+    
+    def close(self):
+        """Quit every browser launched by the pool"""
+        with self._lock:
+            drivers, self._launched = list(self._launched), {}
+            self._idle = {True: [], False: []}
+        for driver in drivers:
+            self._quit(driver)
 
 
 class SharpPrinterConfigurator:
     """Automates SMTP configuration for Sharp printers"""
     
-    def __init__(self, config_path="config.yaml"):
+    def __init__(self, config_path="config.yaml", screenshots_dir="screenshots", driver_pool=None,
+                 label=None):
         """Initialize configurator with settings from YAML file"""
+        self.label = label
         self.config = self._load_config(config_path)
+        settings = self.config['settings']
+        self.headless = settings.get('headless', False)
+        self.wait_timeout = settings.get('wait_timeout', 10)
+        self.screenshot_on_success = settings.get('screenshot_on_success', not self.headless)
+        self.screenshot_on_failure = settings.get('screenshot_on_failure', True)
+        self.target = self.config['target']
+        self.smtp = self.config['smtp']
+        self.creds = self.config['credentials']
         self.driver = None
-        self.screenshots_dir = Path("screenshots")
-        self.screenshots_dir.mkdir(exist_ok=True)
+        self.driver_pool = driver_pool
+        self.screenshots_dir = Path(screenshots_dir)
+        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # One timestamp per run plus a counter keeps screenshot names unique and ordered
+        self._session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._shot_ix = 0
         
+    def _print(self, message=""):
+        """Print a log line, tagged with the printer label when running in a fleet"""
+        if self.label:
+            stripped = message.lstrip("\n")
+            message = f"{message[:len(message) - len(stripped)]}[{self.label}] {stripped}"
+        # One write per line so concurrent printers don't interleave mid-line
+        print(message + "\n", end="", flush=True)
+    
     def _load_config(self, config_path):
         """Load configuration from YAML file"""
         try:
             with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
         except FileNotFoundError:
-            print(f"[ERROR] Config file not found: {config_path}")
-            print("[INFO] Copy config.example.yaml to config.yaml and customize it")
+            self._print(f"[ERROR] Config file not found: {config_path}")
+            self._print("[INFO] Copy config.example.yaml to config.yaml and customize it")
             exit(1)
+        
+        # Fail now rather than partway through the browser session
+        # An empty section (e.g. a bare "smtp:") loads as None, so require a mapping
+        if not isinstance(config, dict):
+            config = {}
+        missing = [key for key in REQUIRED_SECTIONS if not isinstance(config.get(key), dict)]
+        if missing:
+            self._print(f"[ERROR] Config file {config_path} is missing or has empty sections: {', '.join(missing)}")
+            exit(1)
+        return config
     
     def _take_screenshot(self, name):
-        """Save screenshot with timestamp"""
+        """Save step screenshot, unless disabled (off by default when headless)"""
+        if self.screenshot_on_success:
+            self._take_error_screenshot(name)
+    
+    def _take_error_screenshot(self, name):
+        """Save screenshot with session timestamp and sequence number"""
         if self.driver:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = self.screenshots_dir / f"{name}_{timestamp}.png"
-            self.driver.save_screenshot(str(filename))
-            print(f"[SCREENSHOT] Saved: {filename}")
+            self._shot_ix += 1
+            filename = self.screenshots_dir / f"{self._session}_{self._shot_ix:02d}_{name}.png"
+            # Capture synchronously, persist off the automation thread. Best-effort:
+            # this runs on error paths where the browser may already be gone
+            try:
+                png = self.driver.get_screenshot_as_png()
+            except Exception as e:
+                self._print(f"[WARNING] Could not capture screenshot {name}: {e}")
+                return
+            self._io_pool.submit(self._write_png, filename, png)
     
-    def setup_driver(self):
-        """Initialize Chrome WebDriver"""
-        options = webdriver.ChromeOptions()
-        
-        if self.config['settings'].get('headless', False):
-            options.add_argument('--headless')
-            
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1920,1080')
+    def _write_png(self, filename, png):
+        """Write captured screenshot bytes to disk"""
+        # Runs on the I/O pool, where an exception would vanish with the Future
+        try:
+            with open(filename, 'wb', buffering=1 << 19) as f:
+                f.write(png)
+        except OSError as e:
+            self._print(f"[WARNING] Could not save screenshot {filename}: {e}")
+            return
+        self._print(f"[SCREENSHOT] Saved: {filename}")
+    
+    def _wait(self, timeout=None, poll_frequency=0.5):
+        """Return an explicit wait bound to the configured timeout"""
+        from selenium.webdriver.support.ui import WebDriverWait
         
+        if timeout is None:
+            timeout = self.wait_timeout
+        return WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+    
+    def _button_by_text(self, text):
+        """Find the first visible button whose text contains the given text, in one round-trip"""
+        # innerText only covers rendered text, like WebElement.text; buttons without a
+        # layout box (display: none) are skipped, fixed-position ones are kept
+        return self.driver.execute_script(
+            "return [...document.querySelectorAll('button')]"
+            ".find(b => b.getClientRects().length > 0"
+            " && b.innerText.toLowerCase().includes(arguments[0])) || null",
+            text.lower()
+        )
+    
+    def _locate_smtp_fields(self, driver):
+        """Wait condition: SMTP form fields once the gateway field has rendered"""
+        fields = driver.execute_script(FIND_SMTP_FIELDS_JS)
+        return fields if fields['gateway'] else False
+    
+    def _page_text(self, driver=None):
+        """Return the page's visible text"""
+        # innerText in one script call; WebElement.text runs the slower visible-text atom
+        return (driver or self.driver).execute_script("return document.body.innerText") or ""
+    
+    def setup_driver(self):
+        """Initialize Chrome WebDriver, borrowing one from the driver pool if given"""
         try:
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.implicitly_wait(self.config['settings'].get('wait_timeout', 10))
-            print("[SUCCESS] WebDriver initialized")
+            if self.driver_pool:
+                self.driver = self.driver_pool.acquire(self.headless)
+            else:
+                self.driver = create_driver(self.headless)
+            self._print("[SUCCESS] WebDriver initialized")
         except Exception as e:
-            print(f"[ERROR] Failed to initialize WebDriver: {e}")
-            print("[INFO] Make sure Chrome and ChromeDriver are installed")
+            self._print(f"[ERROR] Failed to initialize WebDriver: {e}")
+            self._print("[INFO] Make sure Chrome and ChromeDriver are installed")
+            if self.driver_pool:
+                # Other printers share this process; let run() record the failure
+                raise
             exit(1)
     
     def login(self):
         """Log in to printer web interface"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            url = self.config['target']['url']
-            print(f"[INFO] Navigating to {url}")
+            url = self.target['url']
+            self._print(f"[INFO] Navigating to {url}")
             self.driver.get(url)
             
             # Wait for login page
-            WebDriverWait(self.driver, 10).until(
+            self._wait().until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']"))
             )
             
             # Find and fill username
             username_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='text']")
             username_field.clear()
-            username_field.send_keys(self.config['target']['username'])
+            username_field.send_keys(self.target['username'])
             
             # Find and fill password
             password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
             password_field.clear()
-            password_field.send_keys(self.config['target']['password'])
+            password_field.send_keys(self.target['password'])
             
             # Click login button
             login_button = self.driver.find_element(By.CSS_SELECTOR, "button")
             login_button.click()
             
-            # Wait for login to complete
-            time.sleep(2)
+            # Wait for login to complete (navigation or login form replaced)
+            self._wait().until(EC.any_of(
+                EC.url_changes(url),
+                EC.staleness_of(login_button),
+            ))
             
-            print("[SUCCESS] Logged in successfully")
-            self._take_screenshot("01_logged_in")
+            self._print("[SUCCESS] Logged in successfully")
+            self._take_screenshot("logged_in")
             
         except Exception as e:
-            print(f"[ERROR] Login failed: {e}")
-            self._take_screenshot("error_login_failed")
+            self._print(f"[ERROR] Login failed: {e}")
+            self._take_error_screenshot("error_login_failed")
             raise
     
     def configure_smtp(self):
         """Fill in SMTP configuration form"""
+        from selenium.common.exceptions import NoSuchElementException
+        
         try:
-            print("[INFO] Configuring SMTP settings...")
-            
-            smtp = self.config['smtp']
-            creds = self.config['credentials']
-            
-            # Primary SMTP Gateway
-            gateway_field = self.driver.find_element(By.CSS_SELECTOR, 
-                "input[placeholder='smtp.gmail.com'], input[placeholder='smtp.example.com']")
-            gateway_field.clear()
-            gateway_field.send_keys(smtp['gateway'])
-            print(f"  [OK] Gateway: {smtp['gateway']}")
+            self._print("[INFO] Configuring SMTP settings...")
             
-            # Port
-            port_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
-            for field in port_fields:
-                if field.get_attribute('value') in ['25', '587', '465']:
-                    field.clear()
-                    field.send_keys(str(smtp['port']))
-                    print(f"  [OK] Port: {smtp['port']}")
-                    break
+            # Locate every form field in a single round-trip; the gateway field
+            # doubles as the sync point for the form rendering
+            fields = self._wait().until(self._locate_smtp_fields)
             
-            # Reply Address
-            reply_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='email']")
-            reply_field.clear()
-            reply_field.send_keys(smtp['reply_address'])
-            print(f"  [OK] Reply Address: {smtp['reply_address']}")
+            # SSL/TLS and Authentication dropdowns, both set in one round-trip
+            ssl_selects = fields['selects']
+            dropdowns = [
+                (f"SSL/TLS: {self.smtp['use_ssl']}", self.smtp['use_ssl']),
+                (f"Auth Method: {self.smtp['auth_method']}", self.smtp['auth_method']),
+            ][:len(ssl_selects)]
+            if dropdowns:
+                missing = self.driver.execute_script(
+                    SELECT_OPTIONS_JS,
+                    [[el, value] for el, (_, value) in zip(ssl_selects, dropdowns)]
+                )
+                if missing:
+                    raise NoSuchElementException(f"Cannot locate option with value: {', '.join(missing)}")
+                for label, _ in dropdowns:
+                    self._print(f"  [OK] {label}")
+                
+                # The chosen auth method can reveal the credential fields, so locate
+                # the text fields again now that the dropdowns are set
+                fields = self.driver.execute_script(FIND_SMTP_FIELDS_JS)
             
-            # SSL/TLS Dropdown
-            ssl_selects = self.driver.find_elements(By.CSS_SELECTOR, "select")
-            if ssl_selects:
-                ssl_select = Select(ssl_selects[0])
-                ssl_select.select_by_value(smtp['use_ssl'])
-                print(f"  [OK] SSL/TLS: {smtp['use_ssl']}")
+            if not fields['reply']:
+                raise NoSuchElementException("Reply address field not found")
             
-            # Authentication Dropdown
-            if len(ssl_selects) > 1:
-                auth_select = Select(ssl_selects[1])
-                auth_select.select_by_value(smtp['auth_method'])
-                print(f"  [OK] Auth Method: {smtp['auth_method']}")
+            # Text fields, in the order they are reported
+            entries = [
+                ('gateway', self.smtp['gateway'], f"Gateway: {self.smtp['gateway']}"),
+                ('port', str(self.smtp['port']), f"Port: {self.smtp['port']}"),
+                ('reply', self.smtp['reply_address'], f"Reply Address: {self.smtp['reply_address']}"),
+                ('userid', self.creds['userid'], f"Device Userid: {self.creds['userid']}"),
+                ('device_pw', self.creds['password'], f"Device Password: {'*' * len(self.creds['password'])}"),
+            ]
+            entries = [(fields[key], value, label) for key, value, label in entries if fields[key]]
             
-            # Device Userid
-            userid_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
-            for field in userid_fields:
-                placeholder = field.get_attribute('placeholder')
-                if placeholder and '@' in placeholder:
-                    field.clear()
-                    field.send_keys(creds['userid'])
-                    print(f"  [OK] Device Userid: {creds['userid']}")
-                    break
+            # Set every text field in one round-trip instead of a keystroke per character
+            self.driver.execute_script(FILL_FIELDS_JS, [[el, value] for el, value, _ in entries])
+            for _, _, label in entries:
+                self._print(f"  [OK] {label}")
             
-            # Device Password
-            try:
-                password_field = None
-                all_password_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='password']")
-                
-                # Skip the first one (login password), use the last one (device password)
-                if len(all_password_fields) >= 2:
-                    password_field = all_password_fields[-1]
-                elif len(all_password_fields) == 1:
-                    # If only one password field after login, it's the device password
-                    password_field = all_password_fields[0]
-                
-                if password_field:
-                    password_field.clear()
-                    password_field.send_keys(creds['password'])
-                    print(f"  [OK] Device Password: {'*' * len(creds['password'])}")
-                else:
-                    print(f"  [WARNING] Could not find device password field")
-                    
-            except Exception as e:
-                print(f"  [WARNING] Could not set device password: {e}")
+            if not fields['userid']:
+                self._print(f"  [WARNING] Could not find device userid field")
+            if not fields['device_pw']:
+                self._print(f"  [WARNING] Could not find device password field")
             
-            self._take_screenshot("02_config_filled")
-            print("[SUCCESS] SMTP configuration filled")
+            self._take_screenshot("config_filled")
+            self._print("[SUCCESS] SMTP configuration filled")
             
         except Exception as e:
-            print(f"[ERROR] Configuration failed: {e}")
-            self._take_screenshot("error_config_failed")
+            self._print(f"[ERROR] Configuration failed: {e}")
+            self._take_error_screenshot("error_config_failed")
             raise
     
     def test_connection(self):
         """Click Test Connection button and wait for results"""
+        from selenium.common.exceptions import TimeoutException
+        
         try:
-            print("[INFO] Testing SMTP connection...")
+            self._print("[INFO] Testing SMTP connection...")
             
-            # Find and click Test Connection button
-            buttons = self.driver.find_elements(By.CSS_SELECTOR, "button")
-            for button in buttons:
-                if "test" in button.text.lower():
-                    button.click()
-                    break
+            # Snapshot the page so leftover results from an earlier test are ignored
+            before = self._page_text()
             
-            # Wait for test results
-            time.sleep(3)
+            # Find and click Test Connection button
+            button = self._button_by_text("test")
+            if button:
+                button.click()
             
-            # Check for success or failure
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
+            # Wait for the first new outcome word to appear
+            try:
+                outcome = self._wait(15, poll_frequency=0.25).until(
+                    lambda d: find_new_outcome(
+                        before, self._page_text(d), TEST_OUTCOMES
+                    )
+                )
+            except TimeoutException:
+                outcome = None
             
-            if "ALL TESTS PASSED" in body_text or "SUCCESSFUL" in body_text:
-                print("[SUCCESS] SMTP connection test PASSED")
-                self._take_screenshot("03_test_success")
+            if outcome and outcome[0]:
+                self._print("[SUCCESS] SMTP connection test PASSED")
+                self._take_screenshot("test_success")
                 return True
-            elif "FAILED" in body_text or "error" in body_text.lower():
-                print("[ERROR] SMTP connection test FAILED")
-                self._take_screenshot("03_test_failed")
+            elif outcome:
+                self._print("[ERROR] SMTP connection test FAILED")
+                self._take_error_screenshot("test_failed")
                 return False
             else:
-                print("[WARNING] Test results unclear")
-                self._take_screenshot("03_test_unknown")
+                self._print("[WARNING] Test results unclear")
+                self._take_error_screenshot("test_unknown")
                 return None
                 
         except Exception as e:
-            print(f"[ERROR] Test connection failed: {e}")
-            self._take_screenshot("error_test_failed")
+            self._print(f"[ERROR] Test connection failed: {e}")
+            self._take_error_screenshot("error_test_failed")
             return False
     
     def submit_configuration(self):
-        """Submit the configuration"""
+        """Submit the configuration; returns True once the page confirms it,
+        False if it reports a failure and None if no confirmation was seen"""
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
+        
         try:
-            print("[INFO] Submitting configuration...")
+            self._print("[INFO] Submitting configuration...")
+            
+            before = self._page_text()
             
             # Find and click Submit button
-            buttons = self.driver.find_elements(By.CSS_SELECTOR, "button")
-            for button in buttons:
-                if "submit" in button.text.lower():
-                    button.click()
-                    break
+            button = self._button_by_text("submit")
+            if not button:
+                raise NoSuchElementException("Submit button not found")
+            button.click()
+            
+            def acknowledged(driver):
+                # A new outcome word or a re-rendered form acknowledges the submit;
+                # a re-render only counts as success if it reports no failure
+                outcome = find_new_outcome(before, self._page_text(driver), SUBMIT_OUTCOMES)
+                if outcome:
+                    return outcome
+                if EC.staleness_of(button)(driver):
+                    return True, None
+                return False
             
-            time.sleep(2)
-            self._take_screenshot("04_submitted")
-            print("[SUCCESS] Configuration submitted successfully")
+            try:
+                outcome = self._wait().until(acknowledged)
+            except TimeoutException:
+                outcome = None
+            
+            if outcome and outcome[0]:
+                self._take_screenshot("submitted")
+                self._print("[SUCCESS] Configuration submitted successfully")
+                return True
+            elif outcome:
+                self._print(f"[ERROR] Printer reported a submit failure ({outcome[1]})")
+                self._take_error_screenshot("submit_failed")
+                return False
+            else:
+                self._print("[WARNING] No submit confirmation seen within timeout")
+                self._take_error_screenshot("submit_unconfirmed")
+                return None
             
         except Exception as e:
-            print(f"[ERROR] Submit failed: {e}")
-            self._take_screenshot("error_submit_failed")
+            self._print(f"[ERROR] Submit failed: {e}")
+            self._take_error_screenshot("error_submit_failed")
             raise
     
+    def _print_unconfirmed_submit(self):
+        """Report a submit the printer did not acknowledge"""
+        self._print("[WARNING] Configuration submitted but NOT confirmed by the printer")
+        self._print("[INFO] Check the printer's SMTP settings and the submit screenshots")
+    
     def run(self, test_only=False, skip_test=False):
-        """Execute the full configuration workflow"""
+        """Execute the full configuration workflow; returns True if it completed"""
+        succeeded = False
         try:
-            print("\n" + "="*60)
-            print("Sharp Printer SMTP Configuration Automation")
-            print("="*60 + "\n")
+            self._print("\n" + "="*60)
+            self._print("Sharp Printer SMTP Configuration Automation")
+            self._print("="*60 + "\n")
             
             self.setup_driver()
             self.login()
             self.configure_smtp()
             
             if test_only:
-                print("\n[TEST MODE] Testing connection without submitting")
-                self.test_connection()
+                self._print("\n[TEST MODE] Testing connection without submitting")
+                succeeded = bool(self.test_connection())
             elif skip_test:
-                print("\n[WARNING] Skipping test (real printer mode)")
-                self.submit_configuration()
-                print("\n" + "="*60)
-                print("[SUCCESS] CONFIGURATION SUBMITTED (without test)")
-                print("[INFO] Verify SMTP works by sending a test scan")
-                print("="*60)
+                self._print("\n[WARNING] Skipping test (real printer mode)")
+                submitted = self.submit_configuration()
+                succeeded = bool(submitted)
+                self._print("\n" + "="*60)
+                if submitted:
+                    self._print("[SUCCESS] CONFIGURATION SUBMITTED (without test)")
+                    self._print("[INFO] Verify SMTP works by sending a test scan")
+                else:
+                    self._print_unconfirmed_submit()
+                self._print("="*60)
             else:
                 test_result = self.test_connection()
                 
                 if test_result:
-                    self.submit_configuration()
-                    print("\n" + "="*60)
-                    print("[SUCCESS] CONFIGURATION COMPLETED SUCCESSFULLY")
-                    print("="*60)
+                    submitted = self.submit_configuration()
+                    succeeded = bool(submitted)
+                    self._print("\n" + "="*60)
+                    if submitted:
+                        self._print("[SUCCESS] CONFIGURATION COMPLETED SUCCESSFULLY")
+                    else:
+                        self._print_unconfirmed_submit()
+                    self._print("="*60)
                 else:
-                    print("\n" + "="*60)
-                    print("[WARNING] Configuration filled but NOT submitted due to test failure")
-                    print("[INFO] Review the test results and try again")
-                    print("="*60)
+                    self._print("\n" + "="*60)
+                    self._print("[WARNING] Configuration filled but NOT submitted due to test failure")
+                    self._print("[INFO] Review the test results and try again")
+                    self._print("="*60)
         
         except Exception as e:
-            print(f"\n[ERROR] Automation failed: {e}")
-            if self.config['settings'].get('screenshot_on_failure', True):
-                self._take_screenshot("error_final")
+            self._print(f"\n[ERROR] Automation failed: {e}")
+            if self.screenshot_on_failure:
+                self._take_error_screenshot("error_final")
         
         finally:
-            if self.driver:
-                time.sleep(2)
+            self._io_pool.shutdown(wait=True)
+            if self.driver and self.driver_pool:
+                if self.driver_pool.release(self.driver):
+                    self._print("\n[INFO] Browser tab closed")
+                else:
+                    self._print("\n[WARNING] Could not reset browser session; browser closed")
+            elif self.driver:
                 self.driver.quit()
-                print("\n[INFO] Browser closed")
+                self._print("\n[INFO] Browser closed")
+        
+        return succeeded
 
 
 def main():
@@ -298,7 +637,7 @@ def main():
     parser.add_argument(
         '--config',
         default='config.yaml',
-        help='Path to config file (default: config.yaml)'
+        help='Path to config file, or a directory of configs to run in parallel (default: config.yaml)'
     )
     parser.add_argument(
         '--test-only',
@@ -313,8 +652,48 @@ def main():
     
     args = parser.parse_args()
     
-    configurator = SharpPrinterConfigurator(args.config)
-    configurator.run(test_only=args.test_only, skip_test=args.skip_test)
+    config_path = Path(args.config)
+    
+    if config_path.is_dir():
+        config_files = sorted(list(config_path.glob("*.yaml")) + list(config_path.glob("*.yml")))
+        if not config_files:
+            print(f"[ERROR] No config files found in: {config_path}")
+            exit(1)
+        
+        def run_printer(configurator):
+            # One printer's unexpected failure must not take down the batch
+            try:
+                return configurator.run(test_only=args.test_only, skip_test=args.skip_test)
+            except Exception as e:
+                print(f"[{configurator.label}] [ERROR] Automation failed: {e}\n", end="", flush=True)
+                return False
+        
+        # Workers share pooled browsers (one tab per printer); screenshots are split per printer
+        with DriverPool() as drivers:
+            configurators = [
+                SharpPrinterConfigurator(
+                    path, screenshots_dir=Path("screenshots") / path.name, driver_pool=drivers,
+                    label=path.name
+                )
+                for path in config_files
+            ]
+            print(f"[INFO] Configuring {len(configurators)} printers from {config_path}")
+            with ThreadPoolExecutor(max_workers=min(8, len(configurators))) as pool:
+                results = list(pool.map(run_printer, configurators))
+        
+        print("\n" + "="*60)
+        print("Fleet summary")
+        print("="*60)
+        for configurator, succeeded in zip(configurators, results):
+            print(f"  [{'OK' if succeeded else 'FAILED'}] {configurator.label}")
+        failed = results.count(False)
+        print(f"\n[INFO] {len(results) - failed}/{len(results)} printers configured")
+        if failed:
+            exit(1)
+    else:
+        configurator = SharpPrinterConfigurator(args.config)
+        if not configurator.run(test_only=args.test_only, skip_test=args.skip_test):
+            exit(1)
 
 
 if __name__ == "__main__":